@@ -3,6 +3,7 @@ from datetime import datetime
 from contextlib import contextmanager
 import os
 import logging
+import threading
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -19,14 +20,33 @@ def create_connection():
     conn.row_factory = sqlite3.Row  # This allows accessing columns by name
     return conn
 
+# Connections are reused per thread instead of reopened on every call
+_local = threading.local()
+
+def _get_connection():
+    conn = getattr(_local, 'conn', None)
+    if conn is None:
+        conn = create_connection()
+        _local.conn = conn
+    return conn
+
+def close_connection():
+    """Close this thread's cached connection, if any"""
+    conn = getattr(_local, 'conn', None)
+    if conn is not None:
+        conn.close()
+        _local.conn = None
+
 # Context manager for database connections
 @contextmanager
 def get_db():
-    conn = create_connection()
+    conn = _get_connection()
     try:
         yield conn
     finally:
-        conn.close()
+        # Discard anything left uncommitted, as closing the connection used to
+        if conn.in_transaction:
+            conn.rollback()
 
 # Initialize the database when module is imported
 def init_db():
@@ -83,6 +103,7 @@ def init_db():
 # Function to reset the database (for testing/debugging)
 def reset_database():
     logger.info("Resetting database...")
+    close_connection()
     if os.path.exists(DB_PATH):
         os.remove(DB_PATH)
         logger.info("Deleted existing database file")
@@ -123,21 +144,12 @@ def add_to_watchlist(user_id: int, stock_symbol: str, stock_name: str = None, la
                     last_updated = ?
             ''', (stock_symbol, stock_name, last_price, last_updated, stock_name, last_price, last_updated))
             
-            # Get the stock ID
-            cursor.execute('SELECT id FROM stocks WHERE symbol = ?', (stock_symbol,))
-            stock = cursor.fetchone()
-            if not stock:
-                logger.error(f"[ADD_TO_WATCHLIST] Failed to get stock ID for {stock_symbol}")
-                return False
-            
-            stock_id = stock['id']
-            
-            # Add to watchlist
+            # Add to watchlist, resolving the stock ID in the same statement
             cursor.execute('''
                 INSERT INTO watchlist (user_id, stock_id)
-                VALUES (?, ?)
+                SELECT ?, id FROM stocks WHERE symbol = ?
                 ON CONFLICT(user_id, stock_id) DO NOTHING
-            ''', (user_id, stock_id))
+            ''', (user_id, stock_symbol))
             
             conn.commit()
             logger.info(f"[ADD_TO_WATCHLIST] Successfully added {stock_symbol}")
@@ -159,21 +171,12 @@ def remove_from_watchlist(user_id: int, stock_symbol: str) -> bool:
     with get_db() as conn:
         cursor = conn.cursor()
         try:
-            # First, get the stock_id
-            cursor.execute('SELECT id FROM stocks WHERE symbol = ?', (stock_symbol,))
-            stock = cursor.fetchone()
-            
-            if not stock:
-                logger.error(f"Stock {stock_symbol} not found in stocks table")
-                return False
-                
-            stock_id = stock['id']
-            
-            # Remove from watchlist
+            # Remove from watchlist, resolving the stock ID in the same statement
             cursor.execute('''
                 DELETE FROM watchlist 
-                WHERE user_id = ? AND stock_id = ?
-            ''', (user_id, stock_id))
+                WHERE user_id = ?
+                  AND stock_id IN (SELECT id FROM stocks WHERE symbol = ?)
+            ''', (user_id, stock_symbol))
             
             conn.commit()
             rows_affected = cursor.rowcount
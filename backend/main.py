@@ -1,26 +1,22 @@
 from fastapi import FastAPI
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 import stock_api
 from trading.api import router as trading_router
 from tools.watchlist import router as watchlist_router
 from tools.searxng_search import router as search_router
 import logging
 from database import init_db
+from cors import AllowAllCORSMiddleware
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+# Serialize every response with orjson instead of the stdlib json encoder
+app = FastAPI(default_response_class=ORJSONResponse)
 
-# Configure CORS
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, replace with specific origins
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+# Configure CORS: every origin is allowed, so skip CORSMiddleware's per-request checks
+app.add_middleware(AllowAllCORSMiddleware)  # In production, restrict to specific origins
 
 # Include routers
 app.include_router(stock_api.router, prefix="/stock", tags=["stock"])
@@ -35,6 +31,18 @@ init_db()
 async def root():
     return {"message": "Trading Sim API"}
 
+@app.get("/healthz")
+async def healthz():
+    return {"status": "ok", "yfinance": stock_api.executor_stats()}
+
 if __name__ == "__main__":
+    import sys
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000) 
\ No newline at end of file
+    # uvloop/httptools come with uvicorn[standard]; uvloop has no Windows build
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=8000,
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools"
+    ) 
\ No newline at end of file
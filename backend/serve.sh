@@ -0,0 +1,15 @@
+#!/usr/bin/env bash
+# Production launch: gunicorn managing uvicorn workers.
+# Use `uvicorn main:app --reload` for development instead.
+#
+# The paper-trading bot keeps its portfolio in process memory, so every worker
+# gets its own copy. Only raise WORKERS if you're not using the /trading routes.
+set -euo pipefail
+cd "$(dirname "$0")"
+
+exec gunicorn main:app \
+    -k uvicorn.workers.UvicornWorker \
+    -w "${WORKERS:-1}" \
+    -b "${HOST:-127.0.0.1}:${PORT:-8000}" \
+    --timeout 30 \
+    --keep-alive 5
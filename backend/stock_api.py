@@ -1,18 +1,26 @@
-from fastapi import APIRouter, HTTPException, Depends
-from typing import List, Optional
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from typing import Optional
 from pydantic import BaseModel
 from datetime import datetime, timedelta
-import time
-from functools import wraps
+import asyncio
+import concurrent.futures
+from functools import lru_cache, wraps
 import logging
-import aiohttp
 import os
+import random
+import aiohttp
+import orjson
 from dotenv import load_dotenv
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import yfinance as yf
+from cachetools import TTLCache
 import pandas as pd
-from database import get_db, log_database_contents
-import database as db
-import sqlite3
+from dateutil.tz import tzlocal
+from database import log_database_contents
+from trading._yf_download import download as yf_download
 
 # Load environment variables
 load_dotenv()
@@ -23,7 +31,160 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-def retry_on_failure(max_retries=3, delay=1):
+# Per-symbol response caches holding the encoded JSON body, so hits skip serialization too:
+# quotes move at most every few seconds, news every minute
+STOCK_CACHE_TTL = 5
+NEWS_CACHE_TTL = 60
+_stock_cache = TTLCache(maxsize=2048, ttl=STOCK_CACHE_TTL)
+_news_cache = TTLCache(maxsize=2048, ttl=NEWS_CACHE_TTL)
+
+def _json_response(body: bytes, max_age: int) -> Response:
+    """Send already-encoded JSON as-is"""
+    return Response(content=body, media_type="application/json", headers={"Cache-Control": f"max-age={max_age}"})
+
+# One pooled keep-alive session for every Yahoo request instead of a new TLS handshake each time
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=Retry(total=0)))
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
+)
+SESSION.headers["User-Agent"] = USER_AGENT
+
+# Native async client for plain JSON endpoints (news search) that need no yfinance parsing
+YAHOO_SEARCH_URL = "https://query2.finance.yahoo.com/v1/finance/search"
+_http: Optional[aiohttp.ClientSession] = None
+
+def _get_http() -> aiohttp.ClientSession:
+    """Create the shared aiohttp session lazily, inside the running event loop"""
+    global _http
+    if _http is None or _http.closed:
+        _http = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300),
+            timeout=aiohttp.ClientTimeout(total=5),
+            headers={"User-Agent": USER_AGENT}
+        )
+    return _http
+
+@router.on_event("shutdown")
+async def _close_http():
+    if _http is not None and not _http.closed:
+        await _http.close()
+
+# Shared pool for blocking yfinance calls so handlers never block the event loop
+EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=32)
+
+# Cap executor calls in flight so bursts queue on the loop instead of piling onto the pool
+# (and onto Yahoo's rate limiter); defaults to twice the pool size
+YF_CONCURRENCY = int(os.getenv("YF_CONCURRENCY", "64"))
+YF_SEM = asyncio.Semaphore(YF_CONCURRENCY)
+_yf_active = 0
+
+async def _a(fn, *args, **kwargs):
+    """Run a blocking call on the shared executor and await its result"""
+    global _yf_active
+    async with YF_SEM:
+        _yf_active += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(EXECUTOR, lambda: fn(*args, **kwargs))
+        finally:
+            _yf_active -= 1
+
+def executor_stats() -> dict:
+    return {"active": _yf_active, "limit": YF_CONCURRENCY}
+
+# Process-wide yfinance data caches keyed by (kind, symbol, ...)
+INFO_CACHE = TTLCache(maxsize=2048, ttl=60)
+HISTORY_CACHE = TTLCache(maxsize=2048, ttl=30)
+LONG_HISTORY_CACHE = TTLCache(maxsize=2048, ttl=43200)
+NEWS_CACHE = TTLCache(maxsize=2048, ttl=300)
+PROFILE_CACHE = TTLCache(maxsize=2048, ttl=43200)
+_LONG_PERIODS = frozenset({"1y", "2y", "5y", "10y", "max"})
+# Fetches currently in progress; concurrent misses await the same future
+INFLIGHT: dict = {}
+
+async def _cached(cache: TTLCache, key: tuple, fetch):
+    """Return cache[key], running the blocking fetch at most once per key on a miss"""
+    return await _cached_async(cache, key, lambda: _a(fetch))
+
+async def _fill(cache: TTLCache, key: tuple, fetch):
+    value = await fetch()
+    cache[key] = value
+    return value
+
+async def _cached_async(cache: TTLCache, key: tuple, fetch):
+    """Like _cached, but fetch returns an awaitable instead of blocking"""
+    value = cache.get(key)
+    if value is not None:
+        return value
+        
+    task = INFLIGHT.get(key)
+    if task is None:
+        # The fetch runs as its own task so it isn't tied to whichever request started it
+        task = asyncio.create_task(_fill(cache, key, fetch))
+        INFLIGHT[key] = task
+        
+        def _done(t: asyncio.Task):
+            INFLIGHT.pop(key, None)
+            if not t.cancelled():
+                t.exception()  # Mark retrieved so failures nobody awaited don't log a warning
+                
+        task.add_done_callback(_done)
+        
+    # Every caller, the first included, awaits through a shield: a cancelled request
+    # (client disconnect) stops waiting without cancelling the fetch for the others
+    return await asyncio.shield(task)
+
+def _ticker(symbol: str) -> yf.Ticker:
+    """A fresh Ticker on the shared session; instances memoize their data, so never reuse one"""
+    return yf.Ticker(symbol, session=SESSION)
+
+async def _get_info(symbol: str) -> dict:
+    return await _cached(INFO_CACHE, ("info", symbol), lambda: _ticker(symbol).info)
+
+async def _get_profile(symbol: str) -> dict:
+    """Full .info for slow-moving fields (names, sector, ratios), kept for hours"""
+    return await _cached(PROFILE_CACHE, ("profile", symbol), lambda: _ticker(symbol).info)
+
+async def _get_recommendations(symbol: str):
+    return await _cached(INFO_CACHE, ("recommendations", symbol), lambda: _ticker(symbol).recommendations)
+
+async def _get_history(symbol: str, period: str, interval: str = "1d") -> pd.DataFrame:
+    cache = LONG_HISTORY_CACHE if period in _LONG_PERIODS else HISTORY_CACHE
+    return await _cached(
+        cache,
+        ("history", symbol, period, interval),
+        lambda: _ticker(symbol).history(period=period, interval=interval)
+    )
+
+async def _fetch_news(symbol: str) -> list:
+    # Same search endpoint yfinance's Ticker.news wraps, awaited directly instead of on a thread
+    params = {"q": symbol, "newsCount": 10, "quotesCount": 0}
+    async with _get_http().get(YAHOO_SEARCH_URL, params=params) as resp:
+        resp.raise_for_status()
+        data = await resp.json(content_type=None)
+    # Ensure we have a list even if news is None
+    return data.get("news") or []
+
+async def _get_news(symbol: str) -> list:
+    return await _cached_async(NEWS_CACHE, ("news", symbol), lambda: _fetch_news(symbol))
+
+RETRYABLE_ERRORS = (requests.RequestException, aiohttp.ClientError, ConnectionError, asyncio.TimeoutError)
+
+def _is_retryable(error: Exception) -> bool:
+    """Only transient network failures and upstream 5xx responses are worth retrying"""
+    if isinstance(error, HTTPException):
+        # Handlers wrap every failure in an HTTPException raised `from` the original;
+        # judge by that cause, so bad data or deliberate 404s aren't retried
+        cause = error.__cause__
+        return isinstance(cause, Exception) and _is_retryable(cause)
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code >= 500
+    return isinstance(error, RETRYABLE_ERRORS)
+
+def retry_on_failure(max_retries=3, delay=1, max_delay=10):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
@@ -32,29 +193,36 @@ def retry_on_failure(max_retries=3, delay=1):
                 try:
                     return await func(*args, **kwargs)
                 except Exception as e:
+                    if not _is_retryable(e):
+                        raise
                     last_error = e
                     logger.warning(f"Attempt {attempt + 1} failed: {str(e)}")
                     if attempt < max_retries - 1:
-                        time.sleep(delay)
+                        # Jittered exponential backoff without blocking the event loop
+                        backoff = min(delay * (2 ** attempt), max_delay)
+                        await asyncio.sleep(backoff + random.uniform(0, 0.1))
             raise last_error
         return wrapper
     return decorator
 
+_EXCHANGE_MAP = (
+    ('TSE:', '.T'),    # Tokyo Stock Exchange
+    ('TSEC:', '.TW'),  # Taiwan Stock Exchange
+    ('LSE:', '.L'),    # London Stock Exchange
+    ('FRA:', '.F'),    # Frankfurt Stock Exchange
+    ('HKG:', '.HK'),   # Hong Kong Stock Exchange
+)
+
+@lru_cache(maxsize=4096)
 def format_symbol(symbol: str) -> str:
     """Format symbol to handle different exchanges."""
     symbol = symbol.upper()
+    if ':' not in symbol:
+        return symbol
     
-    exchange_mappings = {
-        'TSE:': '.T',    # Tokyo Stock Exchange
-        'TSEC:': '.TW',  # Taiwan Stock Exchange
-        'LSE:': '.L',    # London Stock Exchange
-        'FRA:': '.F',    # Frankfurt Stock Exchange
-        'HKG:': '.HK',   # Hong Kong Stock Exchange
-    }
-    
-    for prefix, suffix in exchange_mappings.items():
+    for prefix, suffix in _EXCHANGE_MAP:
         if symbol.startswith(prefix):
-            return symbol.replace(prefix, '') + suffix
+            return symbol[len(prefix):] + suffix
             
     return symbol
 
@@ -115,23 +283,136 @@ class WatchlistResponse(BaseModel):
     last_price: float | None
     last_updated: str | None
 
+@router.get("/quotes")
+@retry_on_failure(max_retries=3, delay=1)
+async def get_stock_quotes(symbols: str):
+    """Latest quotes for a comma-separated list of symbols in one batched download"""
+    try:
+        formatted_symbols = [format_symbol(s.strip()) for s in symbols.split(',') if s.strip()]
+        if not formatted_symbols:
+            raise HTTPException(status_code=400, detail="No symbols provided")
+            
+        data = await _a(
+            yf_download,
+            formatted_symbols,
+            period="5d",
+            group_by="ticker",
+            threads=True,
+            progress=False,
+            session=SESSION
+        )
+        
+        quotes = []
+        for formatted_symbol in formatted_symbols:
+            try:
+                frame = data[formatted_symbol] if isinstance(data.columns, pd.MultiIndex) else data
+                # Mixed-exchange batches share a union index, so keep only the rows this
+                # symbol actually traded and read price and volume from the same row
+                rows = frame.dropna(subset=["Close"])
+                if rows.empty:
+                    continue
+                closes = rows["Close"]
+                current_price = float(closes.iloc[-1])
+                previous_close = float(closes.iloc[-2]) if len(closes) > 1 else current_price
+                volume = rows["Volume"].iloc[-1]
+                change = current_price - previous_close
+                quotes.append({
+                    "symbol": formatted_symbol,
+                    "currentPrice": current_price,
+                    "change": change,
+                    "changePercent": (change / previous_close * 100) if previous_close else 0,
+                    "volume": int(volume) if pd.notna(volume) else 0
+                })
+            except Exception as e:
+                logger.warning(f"No quote data for {formatted_symbol}: {e}")
+                continue
+                
+        return {"quotes": quotes}
+        
+    except HTTPException as he:
+        raise he
+    except Exception as e:
+        logger.error(f"Error fetching quotes for {symbols}: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+# Registered before /{symbol}, which would otherwise capture "market-news" as a symbol
+@router.get("/market-news", response_class=ORJSONResponse)
+@retry_on_failure(max_retries=3, delay=1)
+async def get_market_news(
+    from_date: str = None,
+    to_date: str = None,
+    tickers: str = None,
+    limit: int = 50
+):
+    try:
+        logger.info(f"Starting market news fetch with params: from={from_date}, to={to_date}, tickers={tickers}")
+        
+        # Get news for major indices
+        indices = ["^GSPC", "^DJI", "^IXIC"]  # S&P 500, Dow Jones, NASDAQ
+        if tickers:
+            indices.extend(tickers.split(','))
+        
+        # Fetch every symbol's news concurrently over the shared async session
+        results = await asyncio.gather(
+            *(_get_news(symbol) for symbol in indices),
+            return_exceptions=True
+        )
+        
+        all_news = []
+        seen = set()
+        for symbol, news_items in zip(indices, results):
+            if isinstance(news_items, Exception):
+                logger.warning(f"Error fetching news for {symbol}: {news_items}")
+                continue
+            for item in news_items:
+                # The same article is often linked from several indices
+                key = item.get("link") or item.get("uuid") or item.get("title")
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                # Tag a copy with its symbol so the cached item stays untouched
+                all_news.append({**item, "symbol": symbol})
+        
+        # Sort by publish time, limit and format the response
+        formatted_news = _build_feed(all_news, limit=limit)
+        
+        logger.info(f"Successfully fetched {len(formatted_news)} news items")
+        return ORJSONResponse({"feed": formatted_news})
+                
+    except Exception as e:
+        logger.error(f"Error in market news endpoint: {str(e)}")
+        logger.exception("Full traceback:")
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
 @router.get("/{symbol}")
 @retry_on_failure(max_retries=3, delay=1)
-async def get_stock_info(symbol: str):
+async def get_stock_info(symbol: str, background_tasks: BackgroundTasks):
     try:
+        cached = _stock_cache.get(symbol)
+        if cached is not None:
+            return _json_response(cached, STOCK_CACHE_TTL)
+            
         formatted_symbol = format_symbol(symbol)
         logger.info(f"Fetching data for symbol: {formatted_symbol}")
         
-        stock = yf.Ticker(formatted_symbol)
-        info = stock.info
+        # One .info request (cached for a minute) carries both the quote and the profile
+        # fields; it runs together with the recommendations request
+        info, recommendations = await asyncio.gather(
+            _get_info(formatted_symbol),
+            _get_recommendations(formatted_symbol),
+            return_exceptions=True
+        )
+        if isinstance(info, Exception):
+            raise info
         
         if not info:
             logger.error(f"No info data found for {formatted_symbol}")
             raise HTTPException(status_code=404, detail=f"No data found for symbol {symbol}")
 
         # Get current price and market data
-        current_price = info.get("currentPrice", info.get("regularMarketPrice", 0))
-        previous_close = info.get("previousClose", info.get("regularMarketPreviousClose", 0))
+        current_price = info.get("currentPrice") or info.get("regularMarketPrice", 0)
+        previous_close = info.get("previousClose") or info.get("regularMarketPreviousClose", 0)
         
         # Calculate change and change percent
         change = current_price - previous_close if previous_close else 0
@@ -139,7 +420,8 @@ async def get_stock_info(symbol: str):
 
         # Get analyst rating
         try:
-            recommendations = stock.recommendations
+            if isinstance(recommendations, Exception):
+                raise recommendations
             latest_rating = None
             if recommendations is not None and not recommendations.empty:
                 latest = recommendations.iloc[-1]
@@ -159,15 +441,17 @@ async def get_stock_info(symbol: str):
         dividend_yield = info.get('dividendYield') or info.get('trailingAnnualDividendYield')
         fifty_two_week_high = info.get('fiftyTwoWeekHigh') or info.get('regularMarketDayHigh')
         fifty_two_week_low = info.get('fiftyTwoWeekLow') or info.get('regularMarketDayLow')
+        volume = info.get('volume') or info.get('regularMarketVolume', 0)
+        market_cap = info.get('marketCap', 0)
 
         stock_info = StockInfo(
             symbol=symbol,
             currentPrice=float(current_price),
             change=float(change),
             changePercent=float(change_percent),
-            volume=info.get('volume', info.get('regularMarketVolume', 0)),
-            marketCap=info.get('marketCap', 0),
-            peRatio=info.get('forwardPE', info.get('trailingPE')),
+            volume=int(volume or 0),
+            marketCap=float(market_cap or 0),
+            peRatio=info.get('forwardPE') or info.get('trailingPE'),
             dividendYield=dividend_yield,
             fiftyTwoWeekHigh=fifty_two_week_high,
             fiftyTwoWeekLow=fifty_two_week_low,
@@ -183,18 +467,21 @@ async def get_stock_info(symbol: str):
             priceToBook=price_to_book
         )
         
-        # Add this line where you want to log the database contents
-        log_database_contents()
+        body = orjson.dumps(stock_info.model_dump())
+        _stock_cache[symbol] = body
         
-        return stock_info
+        # Log the database contents after the response is sent, off the event loop
+        background_tasks.add_task(log_database_contents)
+        
+        return _json_response(body, STOCK_CACHE_TTL)
         
     except HTTPException as he:
         raise he
     except Exception as e:
         logger.error(f"Error fetching data for {symbol}: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
-@router.get("/history/{symbol}")
+@router.get("/history/{symbol}", response_class=ORJSONResponse)
 @retry_on_failure(max_retries=3, delay=1)
 async def get_stock_history(
     symbol: str,
@@ -208,9 +495,6 @@ async def get_stock_history(
         formatted_symbol = format_symbol(symbol)
         logger.info(f"Formatted symbol: {formatted_symbol}")
         
-        stock = yf.Ticker(formatted_symbol)
-        logger.info(f"Created Ticker object")
-        
         # Try different periods if the first one fails
         periods_to_try = [period, "5d", "1mo", "3mo"]
         history = None
@@ -219,7 +503,7 @@ async def get_stock_history(
             try:
                 # Get history data
                 logger.info(f"Fetching history with period={try_period}, interval={interval}")
-                history = stock.history(period=try_period, interval=interval)
+                history = await _get_history(formatted_symbol, try_period, interval)
                 if not history.empty:
                     logger.info(f"Successfully got data with period={try_period}")
                     break
@@ -230,9 +514,9 @@ async def get_stock_history(
         if history is None or history.empty:
             # Try getting quote data as fallback
             logger.info("Attempting to get current quote data as fallback")
-            info = stock.info
-            if info and (info.get("regularMarketPrice") or info.get("currentPrice")):
-                current_price = info.get("regularMarketPrice") or info.get("currentPrice")
+            info = await _get_info(formatted_symbol)
+            current_price = info.get("regularMarketPrice") or info.get("currentPrice")
+            if current_price:
                 current_time = datetime.now()
                 
                 # Create a single data point with current price
@@ -241,7 +525,7 @@ async def get_stock_history(
                     "High": [current_price],
                     "Low": [current_price],
                     "Close": [current_price],
-                    "Volume": [info.get("volume", 0) or info.get("regularMarketVolume", 0)],
+                    "Volume": [info.get("volume") or info.get("regularMarketVolume") or 0],
                 }, index=[current_time])
             else:
                 logger.error("No history data or current price found")
@@ -274,22 +558,22 @@ async def get_stock_history(
             logger.info(f"First data point: {formatted_data[0]}")
             logger.info(f"Last data point: {formatted_data[-1]}")
             
-        return {"data": formatted_data}
+        # Payload is already plain floats/ints/strings, so skip jsonable_encoder
+        return ORJSONResponse({"data": formatted_data})
         
     except HTTPException as he:
         raise he
     except Exception as e:
         logger.error(f"Error in get_stock_history: {str(e)}")
         logger.exception("Full traceback:")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 @router.get("/similar/{symbol}")
 @retry_on_failure(max_retries=3, delay=1)
 async def get_similar_stocks(symbol: str):
     try:
         formatted_symbol = format_symbol(symbol)
-        stock = yf.Ticker(formatted_symbol)
-        info = stock.info
+        info = await _get_profile(formatted_symbol)
         
         sector = info.get("sector")
         industry = info.get("industry")
@@ -298,10 +582,10 @@ async def get_similar_stocks(symbol: str):
             raise HTTPException(status_code=404, detail="No sector/industry information available")
             
         similar_stocks = []
-        for similar_symbol in yf.Tickers(f"^{sector}").tickers:
+        for similar_symbol in yf.Tickers(f"^{sector}", session=SESSION).tickers:
             if similar_symbol != formatted_symbol:
                 try:
-                    similar_info = similar_symbol.info
+                    similar_info = await _a(lambda: similar_symbol.info)
                     if similar_info.get("industry") == industry:
                         similar_stocks.append({
                             "symbol": similar_symbol.ticker,
@@ -319,15 +603,14 @@ async def get_similar_stocks(symbol: str):
         raise he
     except Exception as e:
         logger.error(f"Error finding similar stocks for {symbol}: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
 
 @router.get("/dividends/{symbol}")
 @retry_on_failure(max_retries=3, delay=1)
 async def get_dividend_history(symbol: str):
     try:
         formatted_symbol = format_symbol(symbol)
-        stock = yf.Ticker(formatted_symbol)
-        dividends = stock.dividends
+        dividends = await _a(lambda: _ticker(formatted_symbol).dividends)
         
         return [
             {
@@ -338,7 +621,57 @@ async def get_dividend_history(symbol: str):
         ]
     except Exception as e:
         logger.error(f"Error fetching dividends for {symbol}: {str(e)}")
-        raise HTTPException(status_code=400, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+def _publish_time(item: dict) -> float:
+    """providerPublishTime as epoch seconds; malformed values count as 0 instead of failing the feed"""
+    try:
+        ts = float(item.get("providerPublishTime") or 0)
+    except (TypeError, ValueError):
+        return 0.0
+    return ts if ts == ts else 0.0  # NaN
+
+def _format_publish_times(news_items: list) -> list:
+    """Format providerPublishTime for a batch of news items in one vectorized pass"""
+    timestamps = pd.to_datetime(
+        [_publish_time(item) for item in news_items], unit="s", utc=True, errors="coerce"
+    )
+    formatted = timestamps.tz_convert(tzlocal()).strftime("%Y-%m-%d %H:%M:%S")
+    # Out-of-range times come back as NaT, which formats to NaN
+    return [value if isinstance(value, str) else "" for value in formatted]
+
+def _build_feed(news_items: list, symbol: str = "", limit: Optional[int] = None) -> list:
+    """Format yfinance news items newest-first into the feed shape both news endpoints return"""
+    # Sort on the numeric timestamp and only format the items we keep
+    items = sorted(news_items, key=_publish_time, reverse=True)
+    if limit is not None:
+        items = items[:limit]
+        
+    feed = []
+    feed_append = feed.append
+    for item, time_published in zip(items, _format_publish_times(items)):
+        try:
+            # Get the first thumbnail URL if available
+            thumbnail_url = ""
+            if item.get("thumbnail") and item["thumbnail"].get("resolutions"):
+                thumbnail_url = item["thumbnail"]["resolutions"][0].get("url", "")
+                
+            title = item.get("title", "")
+            publisher = item.get("publisher", "")
+            feed_append({
+                "symbol": item.get("symbol", symbol),
+                "title": title,
+                "url": item.get("link", ""),
+                "time_published": time_published,
+                "summary": publisher + ": " + title,
+                "source": publisher,
+                "image_url": thumbnail_url
+            })
+        except Exception as e:
+            logger.error(f"Error formatting news item: {e}")
+            continue
+            
+    return feed
 
 @router.get("/news/{symbol}")
 @retry_on_failure(max_retries=3, delay=1)
@@ -347,41 +680,26 @@ async def get_stock_news(symbol: str, date: str = None):
         logger.info(f"Fetching news for {symbol}, date={date}")
         formatted_symbol = format_symbol(symbol)
         
-        # Use yfinance to get news
-        stock = yf.Ticker(formatted_symbol)
-        news_items = stock.news or []  # Ensure we have a list even if news is None
+        cached = _news_cache.get(formatted_symbol)
+        if cached is not None:
+            return _json_response(cached, NEWS_CACHE_TTL)
         
-        logger.info(f"Retrieved {len(news_items)} news items from yfinance")
+        news_items = await _get_news(formatted_symbol)
+        
+        logger.info(f"Retrieved {len(news_items)} news items from Yahoo search")
         
         # Format the response
-        formatted_feed = []
-        for item in news_items:
-            try:
-                # Get the first thumbnail URL if available
-                thumbnail_url = ""
-                if item.get("thumbnail") and item["thumbnail"].get("resolutions"):
-                    thumbnail_url = item["thumbnail"]["resolutions"][0].get("url", "")
-                
-                formatted_feed.append({
-                    "title": item.get("title", ""),
-                    "url": item.get("link", ""),
-                    "time_published": datetime.fromtimestamp(item.get("providerPublishTime", 0)).strftime("%Y-%m-%d %H:%M:%S"),
-                    "summary": item.get("publisher", "") + ": " + item.get("title", ""),
-                    "source": item.get("publisher", ""),
-                    "symbol": formatted_symbol,
-                    "image_url": thumbnail_url
-                })
-            except Exception as e:
-                logger.error(f"Error formatting news item: {e}")
-                continue
+        formatted_feed = _build_feed(news_items, symbol=formatted_symbol)
         
         logger.info(f"Returning {len(formatted_feed)} formatted news items")
-        return {"feed": formatted_feed}
+        body = orjson.dumps({"feed": formatted_feed})
+        _news_cache[formatted_symbol] = body
+        return _json_response(body, NEWS_CACHE_TTL)
                 
     except Exception as e:
         logger.error(f"Error in news endpoint: {str(e)}")
         logger.exception("Full traceback:")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 async def get_market_summary(symbol: str, target_date: datetime.date = None):
     """Helper function to get market summary when no news is found"""
@@ -389,9 +707,9 @@ async def get_market_summary(symbol: str, target_date: datetime.date = None):
         if not target_date:
             return {"feed": []}
             
-        stock = yf.Ticker(symbol)
-        hist_data = stock.history(start=target_date - timedelta(days=1), 
-                                end=target_date + timedelta(days=1))
+        stock = _ticker(symbol)
+        hist_data = await _a(stock.history, start=target_date - timedelta(days=1), 
+                             end=target_date + timedelta(days=1))
         
         if not hist_data.empty:
             target_data = hist_data.loc[hist_data.index.date == target_date]
@@ -417,122 +735,33 @@ async def get_market_summary(symbol: str, target_date: datetime.date = None):
         logger.error(f"Error creating market summary: {e}")
         return {"feed": []}
 
-@router.get("/market-news")
-@retry_on_failure(max_retries=3, delay=1)
-async def get_market_news(
-    from_date: str = None,
-    to_date: str = None,
-    tickers: str = None,
-    limit: int = 50
-):
-    try:
-        logger.info(f"Starting market news fetch with params: from={from_date}, to={to_date}, tickers={tickers}")
-        
-        # Use yfinance to get news for major indices
-        indices = ["^GSPC", "^DJI", "^IXIC"]  # S&P 500, Dow Jones, NASDAQ
-        if tickers:
-            indices.extend(tickers.split(','))
-        
-        all_news = []
-        for symbol in indices:
-            try:
-                stock = yf.Ticker(symbol)
-                news_items = stock.news or []  # Ensure we have a list even if news is None
-                if news_items:
-                    # Add symbol to each news item
-                    for item in news_items:
-                        item["symbol"] = symbol
-                    all_news.extend(news_items)
-            except Exception as e:
-                logger.warning(f"Error fetching news for {symbol}: {e}")
-                continue
-        
-        # Sort by publish time and limit
-        all_news.sort(key=lambda x: x.get("providerPublishTime", 0), reverse=True)
-        all_news = all_news[:limit]
-        
-        # Format the response
-        formatted_news = []
-        for item in all_news:
-            try:
-                # Get the first thumbnail URL if available
-                thumbnail_url = ""
-                if item.get("thumbnail") and item["thumbnail"].get("resolutions"):
-                    thumbnail_url = item["thumbnail"]["resolutions"][0].get("url", "")
-                
-                formatted_news.append({
-                    "symbol": item.get("symbol", ""),
-                    "title": item.get("title", ""),
-                    "summary": item.get("publisher", "") + ": " + item.get("title", ""),
-                    "url": item.get("link", ""),
-                    "time_published": datetime.fromtimestamp(item.get("providerPublishTime", 0)).strftime("%Y-%m-%d %H:%M:%S"),
-                    "source": item.get("publisher", ""),
-                    "image_url": thumbnail_url
-                })
-            except Exception as e:
-                logger.error(f"Error formatting news item: {e}")
-                continue
-        
-        logger.info(f"Successfully fetched {len(formatted_news)} news items")
-        return {"feed": formatted_news}
-                
-    except Exception as e:
-        logger.error(f"Error in market news endpoint: {str(e)}")
-        logger.exception("Full traceback:")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@router.get("/{symbol}")
-async def get_stock_data(symbol: str):
-    try:
-        # Get stock data from yfinance
-        stock = yf.Ticker(symbol)
-        info = stock.info
-        
-        return {
-            "symbol": symbol,
-            "currentPrice": info.get('regularMarketPrice'),
-            "change": info.get('regularMarketChange'),
-            "changePercent": info.get('regularMarketChangePercent'),
-            "volume": info.get('regularMarketVolume'),
-            "marketCap": info.get('marketCap'),
-            "peRatio": info.get('forwardPE'),
-            "dividendYield": info.get('dividendYield'),
-            "fiftyTwoWeekHigh": info.get('fiftyTwoWeekHigh'),
-            "fiftyTwoWeekLow": info.get('fiftyTwoWeekLow'),
-            "shortName": info.get('shortName'),
-            "longName": info.get('longName'),
-            "sector": info.get('sector'),
-            "industry": info.get('industry')
-        }
-    except Exception as e:
-        logger.error(f"Error fetching stock data for {symbol}: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to fetch stock data: {str(e)}")
-
-@router.get("/detailed/{symbol}")
+@router.get("/detailed/{symbol}", response_class=ORJSONResponse)
 @retry_on_failure(max_retries=3, delay=1)
 async def get_detailed_stock_data(symbol: str):
     try:
         formatted_symbol = format_symbol(symbol)
         logger.info(f"Fetching detailed data for symbol: {formatted_symbol}")
         
-        stock = yf.Ticker(formatted_symbol)
-        info = stock.info
+        info = await _get_info(formatted_symbol)
         
         if not info:
             logger.error(f"No info data found for {formatted_symbol}")
             raise HTTPException(status_code=404, detail=f"No data found for symbol {symbol}")
 
         # Get current price and calculate changes
-        current_price = info.get('currentPrice', info.get('regularMarketPrice', 0))
-        previous_close = info.get('previousClose', info.get('regularMarketPreviousClose', 0))
+        current_price = info.get('currentPrice') or info.get('regularMarketPrice', 0)
+        previous_close = info.get('previousClose') or info.get('regularMarketPreviousClose', 0)
+        total_revenue = info.get('totalRevenue', 0)
+        volume = info.get('volume', 0)
+        short_float = info.get('shortPercentOfFloat')
         change = current_price - previous_close if previous_close else 0
         change_percent = (change / previous_close * 100) if previous_close else 0
 
         # Market Data
         market_data = {
             'marketCap': info.get('marketCap', 0),  # Return raw number
-            'income': info.get('totalRevenue', 0),  # Return raw number
-            'revenue': info.get('totalRevenue', 0),  # Return raw number
+            'income': total_revenue,  # Return raw number
+            'revenue': total_revenue,  # Return raw number
             'bookValue': info.get('bookValue', 0),
             'cashPerShare': info.get('totalCashPerShare', 0),
             'dividendYield': info.get('dividendYield', 0),
@@ -558,9 +787,9 @@ async def get_detailed_stock_data(symbol: str):
         # Technical
         technical = {
             'rsi': info.get('rsi14d', 0),
-            'relVolume': info.get('volume', 0),
-            'volume': info.get('volume', 0),
-            'shortFloat': info.get('shortPercentOfFloat', 0) * 100 if info.get('shortPercentOfFloat') else 0,
+            'relVolume': volume,
+            'volume': volume,
+            'shortFloat': short_float * 100 if short_float else 0,
             'beta': info.get('beta', 0),
             'change': change,
             'changePercent': change_percent,
@@ -578,12 +807,12 @@ async def get_detailed_stock_data(symbol: str):
         logger.info("Detailed data:")
         logger.info(detailed_data)
 
-        return detailed_data
+        return ORJSONResponse(detailed_data)
 
     except Exception as e:
         logger.error(f"Error fetching detailed data for {symbol}: {str(e)}")
         logger.exception("Full traceback:")
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
 
 # Export the router instead of app
 app = router
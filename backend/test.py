@@ -1,23 +1,132 @@
-import yfinance as yf
+import asyncio
 import json
-from pprint import pprint
+import logging
+import os
+import queue
+import re
+import sys
+import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from trading._fundamentals_cache import CACHE_DIR, CACHE_DISABLED, get_or_fetch
 
-def test_stock_data(symbol):
-    print(f"\n=== Testing data fetch for {symbol} ===")
+logger = logging.getLogger(__name__)
+
+def setup_logging():
+    """Route output through a queue so only the listener thread writes to stdout"""
+    log_queue = queue.SimpleQueue()
+    logging.basicConfig(level=logging.INFO, format='%(message)s', handlers=[QueueHandler(log_queue)])
+    listener = QueueListener(log_queue, logging.StreamHandler(sys.stdout))
+    listener.start()
+    return listener
+
+# One keep-alive session shared by every Ticker so requests reuse warm TLS connections.
+# With requests-cache installed (pip install requests-cache) it also serves repeated
+# Yahoo GETs, including the history download, from a local SQLite cache for 15 minutes
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+if requests_cache is not None and not CACHE_DISABLED:
+    SESSION = requests_cache.CachedSession(
+        os.path.join(os.path.dirname(CACHE_DIR), 'yf_http'),
+        backend='sqlite',
+        expire_after=timedelta(minutes=15)
+    )
+else:
+    SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=16))
+
+# Shared pool for the blocking yfinance calls, awaited from the event loop
+EXECUTOR = ThreadPoolExecutor(max_workers=32)
+
+async def _a(fn, *args, **kwargs):
+    """Run a blocking call on the shared executor and await its result"""
+    return await asyncio.get_running_loop().run_in_executor(EXECUTOR, lambda: fn(*args, **kwargs))
+
+# Fetches currently in progress; concurrent identical calls await the same future
+INFLIGHT = {}
+
+async def _coalesced(fn, *args):
+    """Run fn(*args) on the executor once, however many callers ask for it at the same time"""
+    key = (fn, args)
+    fut = INFLIGHT.get(key)
+    if fut is None:
+        fut = asyncio.ensure_future(_a(fn, *args))
+        INFLIGHT[key] = fut
+        fut.add_done_callback(lambda _: INFLIGHT.pop(key, None))
+    # Shield so one cancelled caller doesn't cancel the fetch for everyone
+    return await asyncio.shield(fut)
+
+# Memoized fetchers so rerunning a symbol (e.g. from a REPL) skips the network entirely.
+# info and statements also go through the backend's on-disk fundamentals cache so warm
+# reruns of the script skip Yahoo too (set TRADING_NO_CACHE=1 to force fresh data)
+@lru_cache(maxsize=1024)
+def get_ticker(symbol):
+    # yfinance drags in pandas/numpy; import it only once data is actually fetched
+    import yfinance as yf
+    return yf.Ticker(symbol, session=SESSION)
+
+@lru_cache(maxsize=1024)
+def get_info(symbol):
+    return get_or_fetch(symbol, lambda: get_ticker(symbol).info, ttl=900)
+
+@lru_cache(maxsize=1024)
+def get_income_stmt(symbol):
+    return get_or_fetch(f"{symbol}.income_stmt", lambda: get_ticker(symbol).income_stmt, ttl=86400)
+
+@lru_cache(maxsize=1024)
+def get_history(symbol, period="1mo", interval="1d"):
+    return get_ticker(symbol).history(period=period, interval=interval)
+
+# Yahoo truncates or rejects multi-symbol requests past roughly ten symbols
+DOWNLOAD_CHUNK_SIZE = 10
+
+def chunks(items, size):
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+def show(data):
+    """Log a dict as indented JSON (C encoder, much quicker than pprint)"""
+    logger.info(json.dumps(data, indent=2, default=str, sort_keys=True))
+
+# Matches info keys worth dumping in the P/E debug section, case-insensitively
+_PE_FIELD = re.compile(r'pe|price', re.IGNORECASE).search
+
+# Key ratios to report, each with the info fields to try in order
+RATIO_FIELDS = (
+    ('PE Ratio', ('trailingPE', 'forwardPE')),
+    ('PEG Ratio', ('pegRatio',)),
+    ('Price to Book', ('priceToBook',)),
+    ('Dividend Yield', ('dividendYield', 'trailingAnnualDividendYield')),
+    ('52 Week High', ('fiftyTwoWeekHigh', 'regularMarketDayHigh')),
+    ('52 Week Low', ('fiftyTwoWeekLow', 'regularMarketDayLow')),
+)
+
+async def test_stock_data(symbol, hist=None):
+    logger.info(f"\n=== Testing data fetch for {symbol} ===")
     
     try:
-        # 1. Basic Quote Data
-        print("\n1. Fetching basic quote data...")
-        ticker = yf.Ticker(symbol)
-        info = ticker.info
+        # Start every request for this symbol at once; the sections below log as before
+        logger.info("\n1. Fetching basic quote data...")
+        logger.info("\n2. Fetching financial statements...")
+        # Only the income statement is inspected below (the backend reads no other statement)
+        info, income_stmt = await asyncio.gather(
+            _coalesced(get_info, symbol),
+            _coalesced(get_income_stmt, symbol)
+        )
         
+        # 1. Basic Quote Data
         # Debug PE related fields
-        print("\nP/E Related Fields in info:")
-        pe_fields = {k: v for k, v in info.items() if 'pe' in k.lower() or 'price' in k.lower()}
-        pprint(pe_fields)
+        logger.info("\nP/E Related Fields in info:")
+        pe_fields = {k: v for k, v in info.items() if _PE_FIELD(k)}
+        show(pe_fields)
         
-        print("\nBasic quote data received:")
-        pprint({
+        logger.info("\nBasic quote data received:")
+        show({
             'symbol': info.get('symbol'),
             'currentPrice': info.get('currentPrice'),
             'marketCap': info.get('marketCap'),
@@ -27,61 +136,86 @@ def test_stock_data(symbol):
         })
 
         # 2. Financial Data with column validation
-        print("\n2. Fetching financial statements...")
-        income_stmt = ticker.income_stmt
-        balance_sheet = ticker.balance_sheet
-        cash_flow = ticker.cash_flow
-        
         # Print available columns for debugging
-        print("\nIncome Statement Columns:")
-        print(income_stmt.columns.tolist() if not income_stmt.empty else "No income statement data")
+        logger.info("\nIncome Statement Columns:")
+        logger.info(income_stmt.columns.tolist() if not income_stmt.empty else "No income statement data")
         
-        # Use alternative column names
-        revenue_col = 'Total Revenue' if 'Total Revenue' in income_stmt.columns else 'Revenue'
-        net_income_col = 'Net Income' if 'Net Income' in income_stmt.columns else 'Net Income Common Stockholders'
+        # yfinance statements hold line items as rows and periods (newest first) as columns,
+        # so look the alternative names up in the index and read the first cell directly
+        line_items = income_stmt.index
+        revenue_col = 'Total Revenue' if 'Total Revenue' in line_items else 'Revenue'
+        net_income_col = 'Net Income' if 'Net Income' in line_items else 'Net Income Common Stockholders'
         
-        print("\nFinancial Highlights:")
+        logger.info("\nFinancial Highlights:")
         if not income_stmt.empty:
-            print(f"Revenue (TTM): {income_stmt.iloc[0].get(revenue_col, 'N/A')}")
-            print(f"Net Income (TTM): {income_stmt.iloc[0].get(net_income_col, 'N/A')}")
+            revenue = income_stmt.loc[revenue_col].iat[0] if revenue_col in line_items else 'N/A'
+            net_income = income_stmt.loc[net_income_col].iat[0] if net_income_col in line_items else 'N/A'
+            logger.info(f"Revenue (TTM): {revenue}")
+            logger.info(f"Net Income (TTM): {net_income}")
 
         # 3. Historical Data with validation
-        print("\n3. Fetching historical data...")
-        hist = ticker.history(period="1mo", interval="1d")
-        print(f"Historical data points: {len(hist)}")
+        logger.info("\n3. Fetching historical data...")
+        # main() downloads every symbol's history in one batch; fetch it here otherwise
+        if hist is None:
+            hist = await _coalesced(get_history, symbol, "1mo", "1d")
+        logger.info(f"Historical data points: {len(hist)}")
         if not hist.empty:
-            print("\nLast 5 days of data:")
-            print(hist[['Open', 'High', 'Low', 'Close', 'Volume']].tail())
+            logger.info("\nLast 5 days of data:")
+            # Slice the rows first so only five rows get copied, not the whole month
+            logger.info(hist.tail()[['Open', 'High', 'Low', 'Close', 'Volume']])
 
         # 4. Additional Metrics with fallbacks
-        print("\n4. Key Ratios:")
+        logger.info("\n4. Key Ratios:")
         ratios = {
-            'PE Ratio': info.get('trailingPE') or info.get('forwardPE'),
-            'PEG Ratio': info.get('pegRatio'),
-            'Price to Book': info.get('priceToBook'),
-            'Dividend Yield': info.get('dividendYield') or info.get('trailingAnnualDividendYield'),
-            '52 Week High': info.get('fiftyTwoWeekHigh') or info.get('regularMarketDayHigh'),
-            '52 Week Low': info.get('fiftyTwoWeekLow') or info.get('regularMarketDayLow')
+            name: next((value for value in map(info.get, keys) if value), None)
+            for name, keys in RATIO_FIELDS
         }
-        pprint(ratios)
+        show(ratios)
 
         return True
 
     except Exception as e:
-        print(f"\nError fetching data: {str(e)}")
+        logger.error(f"\nError fetching data: {str(e)}")
         return False
 
-def main():
+async def main():
+    import yfinance as yf
+    
     # Test with a few different symbols
     symbols = ['AAPL', 'MSFT', 'T']
     
-    results = {}
-    for symbol in symbols:
-        results[symbol] = test_stock_data(symbol)
+    # Batched chart downloads instead of a history call per ticker, split so no request
+    # goes over Yahoo's per-call symbol limit. The batches run one after another:
+    # yf.download keeps its results in module-global state that overlapping calls
+    # would clobber, and each call already threads across its own symbols
+    histories = {}
+    for group in chunks(symbols, DOWNLOAD_CHUNK_SIZE):
+        frame = await _a(
+            yf.download, " ".join(group), period="1mo", interval="1d",
+            group_by='ticker', threads=True, progress=False, session=SESSION
+        )
+        for symbol in group:
+            # A single-symbol download comes back without the ticker column level
+            hist = frame[symbol] if len(group) > 1 else frame
+            histories[symbol] = hist.dropna(how='all')
     
-    print("\n=== Summary ===")
+    # Each symbol is network-bound, so run them all concurrently
+    outcomes = await asyncio.gather(*(test_stock_data(s, histories[s]) for s in symbols))
+    results = dict(zip(symbols, outcomes))
+    
+    logger.info("\n=== Summary ===")
     for symbol, success in results.items():
-        print(f"{symbol}: {'Success' if success else 'Failed'}")
+        logger.info(f"{symbol}: {'Success' if success else 'Failed'}")
 
 if __name__ == "__main__":
-    main()
+    # uvloop comes with uvicorn[standard]; it has no Windows build, so fall back quietly
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+    listener = setup_logging()
+    try:
+        asyncio.run(main())
+    finally:
+        listener.stop()
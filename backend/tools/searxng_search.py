@@ -6,7 +6,6 @@ import traceback
 import json
 import os
 from typing import List, Dict, Optional
-import aiohttp
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
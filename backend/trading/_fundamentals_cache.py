@@ -0,0 +1,50 @@
+import os
+import pickle
+import time
+import logging
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+# Cache directory lives next to the backend package, like stocks.db
+CACHE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    '.cache',
+    'fundamentals'
+)
+
+# Set TRADING_NO_CACHE=1 to always hit Yahoo (useful when debugging)
+CACHE_DISABLED = os.getenv("TRADING_NO_CACHE", "").lower() in ("1", "true", "yes")
+
+def _cache_path(symbol: str) -> str:
+    safe_symbol = symbol.upper().replace('/', '_').replace('\\', '_')
+    return os.path.join(CACHE_DIR, f"{safe_symbol}.pkl")
+
+def get_or_fetch(symbol: str, fetcher: Callable[[], Any], ttl: int = 43200) -> Any:
+    """Return cached fundamentals (a dict or DataFrame) for symbol, calling fetcher when missing or older than ttl seconds"""
+    if CACHE_DISABLED:
+        return fetcher()
+
+    path = _cache_path(symbol)
+    try:
+        with open(path, 'rb') as f:
+            entry = pickle.load(f)
+        if time.time() - entry['t'] < ttl:
+            return entry['data']
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable fundamentals cache for {symbol}: {e}")
+
+    data = fetcher()
+    # len() rather than truthiness so DataFrames can be cached too
+    if data is not None and len(data):
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                pickle.dump({'t': time.time(), 'data': data}, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Failed to write fundamentals cache for {symbol}: {e}")
+    return data
@@ -0,0 +1,25 @@
+import numpy as np
+
+def kelly_sizes(
+    portfolio_value,
+    confidence: np.ndarray,
+    price: np.ndarray,
+    max_pct: float = 0.2,
+    kelly_frac: float = 0.5
+) -> np.ndarray:
+    """
+    Vectorized Kelly Criterion position sizing:
+    - shares = portfolio_value * confidence * kelly_frac / price
+    - capped at max_pct of the portfolio
+    - zero for missing or non-positive prices
+    """
+    confidence = np.asarray(confidence, dtype=np.float64)
+    price = np.asarray(price, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shares = np.floor(portfolio_value * confidence * kelly_frac / price)
+        max_shares = np.floor(portfolio_value * max_pct / price)
+        sizes = np.minimum(shares, max_shares)
+
+    sizes[~np.isfinite(sizes) | (price <= 0)] = 0
+    return sizes.astype(np.int64)
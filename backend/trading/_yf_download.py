@@ -0,0 +1,12 @@
+import threading
+import yfinance as yf
+
+# yf.download collects results in module-global state (shared._DFS/_ERRORS) that it
+# resets on every call, so two overlapping downloads clobber each other's frames.
+# Every caller in the process goes through this lock; each call still threads internally.
+_DOWNLOAD_LOCK = threading.Lock()
+
+def download(*args, **kwargs):
+    """yf.download, serialized process-wide"""
+    with _DOWNLOAD_LOCK:
+        return yf.download(*args, **kwargs)
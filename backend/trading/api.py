@@ -1,6 +1,5 @@
 from fastapi import APIRouter, HTTPException
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import Optional
 from .bot_manager import TradingBot
 from .automated_trader import AutomatedTrader
 import logging
@@ -37,8 +36,10 @@ async def place_trade(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Handlers that price positions are plain defs: the batched price download can wait on
+# the process-wide yf.download lock, so FastAPI runs them on its threadpool, off the loop
 @router.get("/portfolio")
-async def get_portfolio():
+def get_portfolio():
     """Get current portfolio summary"""
     try:
         return trading_bot.get_portfolio_summary()
@@ -46,7 +47,7 @@ async def get_portfolio():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/positions")
-async def get_positions():
+def get_positions():
     """Get active positions"""
     try:
         return trading_bot.get_active_positions()
@@ -70,7 +71,7 @@ async def get_trade_history():
 async def get_active_orders():
     """Get active orders"""
     try:
-        return trading_bot.active_orders
+        return trading_bot.get_active_orders()
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -95,7 +96,7 @@ async def stop_automated_trading():
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/automate/status")
-async def get_automated_status():
+def get_automated_status():
     """Get automated trading status"""
     try:
         return automated_trader.get_status()
@@ -1,8 +1,11 @@
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import asyncio
 import logging
-from datetime import datetime, timedelta
-import yfinance as yf
+from datetime import datetime
+from statistics import fmean
+import numpy as np
+from ._strategy_kernels import kelly_sizes
+from ._yf_download import download
 from .bot_manager import TradingBot
 from .strategy_manager import StrategyManager
 
@@ -16,6 +19,7 @@ class AutomatedTrader:
         self.watched_symbols = initial_symbols or []
         self.last_analysis = {}
         self.trading_task = None
+        self._portfolio_value_cache = 0.0
         
     async def start_trading(self):
         """Start the automated trading loop"""
@@ -44,9 +48,17 @@ class AutomatedTrader:
                 # Update watchlist based on market conditions
                 await self._update_watchlist()
                 
-                # Analyze each symbol and execute trades
+                # Value the portfolio once per tick for position sizing; pricing may wait on
+                # the yf.download lock, so it runs on a worker thread
+                self._portfolio_value_cache = await asyncio.to_thread(self.bot.get_portfolio_value)
+                
+                # Analyze each symbol, then size and place all buys together
+                buy_candidates = []
                 for symbol in self.watched_symbols:
-                    await self._analyze_and_trade(symbol)
+                    candidate = await self._analyze_and_trade(symbol)
+                    if candidate:
+                        buy_candidates.append(candidate)
+                self._place_buys(buy_candidates)
                     
                 # Sleep for the interval (5 minutes)
                 await asyncio.sleep(300)  # 5 minutes
@@ -60,16 +72,29 @@ class AutomatedTrader:
         try:
             # Get market indices for overall market sentiment
             indices = ['^GSPC', '^DJI', '^IXIC']  # S&P 500, Dow, NASDAQ
+
+            # Fetch all indices in one threaded download instead of one .info call each.
+            # A few days back so there are still two closes early in a session or after holidays
+            closes = (await asyncio.to_thread(
+                download, indices, period='5d', progress=False, threads=True
+            ))['Close']
             market_data = {}
-            
             for index in indices:
-                ticker = yf.Ticker(index)
-                info = ticker.info
+                series = closes[index].dropna()
+                if len(series) < 2:
+                    logger.warning(f"Not enough closes to compute change for {index}")
+                    continue
+                last = float(series.iloc[-1])
+                prev = float(series.iloc[-2])
                 market_data[index] = {
-                    'price': info.get('regularMarketPrice', 0),
-                    'change': info.get('regularMarketChangePercent', 0)
+                    'price': last,
+                    'change': (last / prev - 1) * 100
                 }
                 
+            if not market_data:
+                logger.warning("No index data available; keeping current watchlist")
+                return
+
             # Adjust watchlist based on market conditions
             if all(data['change'] > 0 for data in market_data.values()):
                 # Bullish market - focus on growth stocks
@@ -114,13 +139,9 @@ class AutomatedTrader:
         except Exception as e:
             logger.error(f"Error scanning technical setups: {e}")
             
-    async def _analyze_and_trade(self, symbol: str):
-        """Analyze a symbol and execute trades based on strategies"""
+    async def _analyze_and_trade(self, symbol: str) -> Optional[Tuple[str, float, float]]:
+        """Analyze a symbol, exit weak positions and return (symbol, confidence, price) for buys"""
         try:
-            # Get current position if any
-            positions = self.bot.get_active_positions()
-            current_position = positions.get(symbol)
-            
             # Run analysis
             analysis = self.strategy_manager.analyze_stock(symbol)
             self.last_analysis[symbol] = {
@@ -128,31 +149,23 @@ class AutomatedTrader:
                 'data': analysis
             }
             
+            # Nothing to act on if the analysis failed
+            if not analysis:
+                return None
+            
             # Calculate overall confidence
-            total_confidence = sum(
-                strat['confidence'] for strat in analysis.values()
-            ) / len(analysis)
+            total_confidence = fmean(strat['confidence'] for strat in analysis.values())
             
-            # Get current price
+            # Fetch the price once and reuse it for sizing and orders
             current_price = self.strategy_manager.get_current_price(symbol)
             
+            # Get current position if any
+            current_position = self.bot.positions.get(symbol)
+            
             # Execute trades based on analysis
             if not current_position and total_confidence >= 0.7:
-                # Calculate position size based on Kelly Criterion
-                portfolio_value = self.bot.get_portfolio_value()
-                position_size = self._calculate_position_size(
-                    portfolio_value,
-                    total_confidence,
-                    current_price
-                )
-                
-                if position_size > 0:
-                    self.bot.place_order(
-                        symbol=symbol,
-                        order_type='buy',
-                        quantity=position_size,
-                        price=current_price
-                    )
+                # Sized together with the rest of the watchlist in _place_buys
+                return symbol, total_confidence, current_price
                     
             elif current_position and total_confidence < 0.3:
                 # Exit position
@@ -166,28 +179,33 @@ class AutomatedTrader:
         except Exception as e:
             logger.error(f"Error analyzing and trading {symbol}: {e}")
             
-    def _calculate_position_size(
-        self,
-        portfolio_value: float,
-        confidence: float,
-        price: float
-    ) -> float:
-        """Calculate position size using Kelly Criterion"""
-        try:
-            # Implement Kelly Criterion with safety factor
-            kelly_fraction = confidence * 0.5  # Using 50% of Kelly for safety
-            max_position = portfolio_value * kelly_fraction
+        return None
             
-            # Calculate number of shares
-            shares = int(max_position / price)
+    def _place_buys(self, candidates: List[Tuple[str, float, float]]) -> None:
+        """Size all buy candidates with the Kelly Criterion in one pass and place the orders"""
+        if not candidates:
+            return
             
-            # Ensure position size is reasonable
-            max_shares = int(portfolio_value * 0.2 / price)  # Max 20% of portfolio
-            return min(shares, max_shares)
+        try:
+            symbols, confidences, prices = zip(*candidates)
+            # 50% of Kelly for safety, max 20% of portfolio per position
+            sizes = kelly_sizes(
+                self._portfolio_value_cache,
+                np.array(confidences, dtype=np.float64),
+                np.array(prices, dtype=np.float64)
+            )
             
+            for symbol, position_size, price in zip(symbols, sizes, prices):
+                if position_size > 0:
+                    self.bot.place_order(
+                        symbol=symbol,
+                        order_type='buy',
+                        quantity=int(position_size),
+                        price=price
+                    )
+                    
         except Exception as e:
-            logger.error(f"Error calculating position size: {e}")
-            return 0
+            logger.error(f"Error placing buy orders: {e}")
             
     def get_status(self) -> Dict:
         """Get current status of the automated trader"""
@@ -1,42 +1,58 @@
 from typing import Dict, List, Optional
 from datetime import datetime
+from statistics import fmean
 import logging
+import time
+import numpy as np
 from .strategy_manager import StrategyManager
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+def _format_ts(ns: Optional[int]) -> Optional[str]:
+    """Convert a time.time_ns() reading to an ISO-8601 timestamp"""
+    if ns is None:
+        return None
+    return datetime.fromtimestamp(ns / 1e9).isoformat()
+
 class TradingBot:
     def __init__(self, initial_balance: float = 100000):
         self.strategy_manager = StrategyManager()
         self.initial_balance = initial_balance
         self.cash_balance = initial_balance
-        self.positions = {}  # symbol -> {quantity, avg_price}
+        self.positions = {}  # symbol -> {quantity, avg_price, cost_basis}
         self.trade_history = []
         self.active_orders = []
         
     def get_portfolio_value(self) -> float:
         """Calculate total portfolio value including cash and positions"""
-        total_value = self.cash_balance
-        for symbol, position in self.positions.items():
-            try:
-                current_price = self.strategy_manager.get_current_price(symbol)
-                position_value = position['quantity'] * current_price
-                total_value += position_value
-            except Exception as e:
-                logger.error(f"Error calculating position value for {symbol}: {e}")
-        return total_value
+        if not self.positions:
+            return self.cash_balance
+            
+        symbols = list(self.positions)
+        prices = self.strategy_manager.get_current_prices(symbols)
+        quantities = np.fromiter(
+            (self.positions[symbol]['quantity'] for symbol in symbols),
+            dtype=np.float64,
+            count=len(symbols)
+        )
+        current_prices = np.fromiter(
+            (prices.get(symbol, 0) for symbol in symbols),
+            dtype=np.float64,
+            count=len(symbols)
+        )
+        return float(self.cash_balance + quantities @ current_prices)
         
     def analyze_position(self, symbol: str) -> Dict:
         """Analyze a stock using all strategies"""
         try:
             analysis = self.strategy_manager.analyze_stock(symbol)
+            if not analysis:
+                return {}
             
             # Combine strategy signals
-            overall_confidence = sum(
-                strat['confidence'] for strat in analysis.values()
-            ) / len(analysis)
+            overall_confidence = fmean(strat['confidence'] for strat in analysis.values())
             
             # Get position details if we hold the stock
             position = self.positions.get(symbol, {})
@@ -66,7 +82,7 @@ class TradingBot:
                 'quantity': quantity,
                 'price': price,
                 'status': 'pending',
-                'timestamp': datetime.now(),
+                'ts_ns': time.time_ns(),
                 'id': len(self.trade_history) + 1
             }
             
@@ -88,7 +104,7 @@ class TradingBot:
             # Execute order immediately (in real system would be async)
             self.execute_order(order)
             
-            return order
+            return self._serialize_order(order)
             
         except Exception as e:
             logger.error(f"Error placing order: {e}")
@@ -117,13 +133,15 @@ class TradingBot:
                     )
                     self.positions[symbol] = {
                         'quantity': new_quantity,
-                        'avg_price': new_avg_price
+                        'avg_price': new_avg_price,
+                        'cost_basis': new_quantity * new_avg_price
                     }
                 else:
                     # New position
                     self.positions[symbol] = {
                         'quantity': quantity,
-                        'avg_price': price
+                        'avg_price': price,
+                        'cost_basis': quantity * price
                     }
                     
             elif order['type'] == 'sell':
@@ -137,11 +155,13 @@ class TradingBot:
                     del self.positions[symbol]
                 else:
                     # Partial sale
-                    self.positions[symbol]['quantity'] = current_quantity - quantity
+                    position = self.positions[symbol]
+                    position['quantity'] = current_quantity - quantity
+                    position['cost_basis'] = position['quantity'] * position['avg_price']
                     
             # Update order status
             order['status'] = 'executed'
-            order['executed_at'] = datetime.now()
+            order['executed_ns'] = time.time_ns()
             
             # Add to trade history
             self.trade_history.append(order)
@@ -154,24 +174,38 @@ class TradingBot:
             order['status'] = 'failed'
             order['error'] = str(e)
             
+    def _serialize_order(self, order: Dict) -> Dict:
+        """Replace internal nanosecond timestamps with ISO strings"""
+        serialized = {k: v for k, v in order.items() if k not in ('ts_ns', 'executed_ns')}
+        serialized['timestamp'] = _format_ts(order.get('ts_ns'))
+        if 'executed_ns' in order:
+            serialized['executed_at'] = _format_ts(order['executed_ns'])
+        return serialized
+        
     def get_trade_history(self) -> List[Dict]:
         """Get all historical trades"""
-        return self.trade_history
+        return [self._serialize_order(order) for order in self.trade_history]
+        
+    def get_active_orders(self) -> List[Dict]:
+        """Get orders that haven't executed (pending or failed)"""
+        return [self._serialize_order(order) for order in self.active_orders]
         
     def get_active_positions(self) -> Dict:
         """Get current positions with market values"""
         active_positions = {}
+        prices = self.strategy_manager.get_current_prices(list(self.positions))
         for symbol, position in self.positions.items():
             try:
-                current_price = self.strategy_manager.get_current_price(symbol)
+                current_price = prices[symbol]
                 market_value = position['quantity'] * current_price
-                unrealized_pl = market_value - (position['quantity'] * position['avg_price'])
+                cost_basis = position['cost_basis']
+                unrealized_pl = market_value - cost_basis
                 
                 active_positions[symbol] = {
                     **position,
                     'market_value': market_value,
                     'unrealized_pl': unrealized_pl,
-                    'unrealized_pl_percent': (unrealized_pl / (position['quantity'] * position['avg_price'])) * 100
+                    'unrealized_pl_percent': (unrealized_pl / cost_basis * 100) if cost_basis else 0
                 }
             except Exception as e:
                 logger.error(f"Error calculating position details for {symbol}: {e}")
@@ -181,8 +215,11 @@ class TradingBot:
     def get_portfolio_summary(self) -> Dict:
         """Get overall portfolio summary"""
         try:
-            portfolio_value = self.get_portfolio_value()
+            # Price the holdings once and derive the total from the same quotes
             positions = self.get_active_positions()
+            portfolio_value = self.cash_balance + sum(
+                position['market_value'] for position in positions.values()
+            )
             
             return {
                 'total_value': portfolio_value,
@@ -1,15 +1,26 @@
-from typing import Dict, List, Optional
-from datetime import datetime
+from typing import ClassVar, Dict, List
 import logging
-import numpy as np
+import threading
 import pandas as pd
 import yfinance as yf
+from cachetools import TTLCache
+from ._fundamentals_cache import get_or_fetch
+from ._yf_download import download
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Short-lived quote cache shared by every StrategyManager so one tick doesn't
+# re-fetch the same symbol from bot, trader and portfolio valuation
+_price_cache = TTLCache(maxsize=1024, ttl=15)
+_price_lock = threading.Lock()
+
 class StrategyManager:
+    _GROWTH_SECTORS: ClassVar[frozenset] = frozenset({
+        'Technology', 'Consumer Cyclical', 'Consumer Defensive'
+    })
+
     def __init__(self):
         self.strategies = {
             'value_investing': self.value_strategy,
@@ -18,15 +29,63 @@ class StrategyManager:
         }
         
     def get_current_price(self, symbol: str) -> float:
-        """Get the current price of a stock"""
+        """Get the current price of a stock (cached for a few seconds)"""
+        with _price_lock:
+            price = _price_cache.get(symbol)
+        if price:
+            return price
+            
         try:
             stock = yf.Ticker(symbol)
-            info = stock.info
-            return info.get('currentPrice', info.get('regularMarketPrice', 0))
+            # Last close from one short chart request; fall back to the full .info quote
+            closes = stock.history(period='5d')['Close'].dropna()
+            price = float(closes.iloc[-1]) if len(closes) else 0
+            if not price:
+                info = stock.info
+                price = info.get('currentPrice') or info.get('regularMarketPrice', 0)
+            if price:
+                with _price_lock:
+                    _price_cache[symbol] = price
+            return price
         except Exception as e:
             logger.error(f"Error getting current price for {symbol}: {e}")
             return 0
         
+    def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
+        """Get current prices for several stocks with one batched download"""
+        prices = {}
+        missing = []
+        with _price_lock:
+            for symbol in symbols:
+                price = _price_cache.get(symbol)
+                if price:
+                    prices[symbol] = price
+                else:
+                    missing.append(symbol)
+                    
+        if not missing:
+            return prices
+            
+        try:
+            closes = download(missing, period='5d', progress=False, threads=True)['Close']
+            if isinstance(closes, pd.Series):
+                closes = closes.to_frame(missing[0])
+            last = closes.ffill().iloc[-1]
+            with _price_lock:
+                for symbol in missing:
+                    price = last.get(symbol)
+                    if pd.notna(price) and price > 0:
+                        prices[symbol] = _price_cache[symbol] = float(price)
+        except Exception as e:
+            logger.error(f"Error downloading prices for {missing}: {e}")
+            
+        # Fall back to single quotes for anything the batch didn't cover
+        for symbol in missing:
+            if symbol not in prices:
+                prices[symbol] = self.get_current_price(symbol)
+                
+        return prices
+        
     def value_strategy(self, stock_data: Dict) -> Dict:
         """
         Value Investing Strategy (Graham/Buffett):
@@ -35,13 +94,13 @@ class StrategyManager:
         - D/E < 0.3
         """
         try:
-            signals = {
-                'pe_ratio': stock_data['valuation']['pe'] < 15,
-                'pb_ratio': stock_data['valuation']['pb'] < 1.5,
-                'de_ratio': stock_data['valuation']['debtEq'] < 0.3
-            }
+            valuation = stock_data['valuation']
+            s1 = valuation['pe'] < 15
+            s2 = valuation['pb'] < 1.5
+            s3 = valuation['debtEq'] < 0.3
             
-            confidence = sum(signals.values()) / len(signals)
+            confidence = (s1 + s2 + s3) / 3.0
+            signals = {'pe_ratio': s1, 'pb_ratio': s2, 'de_ratio': s3}
             
             return {
                 'strategy': 'value_investing',
@@ -67,15 +126,13 @@ class StrategyManager:
         - Focus on Consumer/Tech sectors
         """
         try:
-            growth_sectors = ['Technology', 'Consumer Cyclical', 'Consumer Defensive']
+            eps = stock_data['growth']['eps']
+            s1 = eps['next5Y'] > 25
+            s2 = stock_data['marketData'].get('sector', '') in self._GROWTH_SECTORS
+            s3 = eps['nextY'] > eps['past5Y']
             
-            signals = {
-                'eps_growth': stock_data['growth']['eps']['next5Y'] > 25,
-                'sector_match': stock_data['marketData'].get('sector', '') in growth_sectors,
-                'high_growth': stock_data['growth']['eps']['nextY'] > stock_data['growth']['eps']['past5Y']
-            }
-            
-            confidence = sum(signals.values()) / len(signals)
+            confidence = (s1 + s2 + s3) / 3.0
+            signals = {'eps_growth': s1, 'sector_match': s2, 'high_growth': s3}
             
             return {
                 'strategy': 'growth_hunting',
@@ -101,17 +158,17 @@ class StrategyManager:
         - Volume analysis
         """
         try:
-            signals = {
-                'rsi_oversold': stock_data['technical']['rsi'] < 30,
-                'volume_surge': stock_data['technical']['relVolume'] > 2,
-                'trend_following': all([
-                    stock_data['technical']['sma20'] > 0,
-                    stock_data['technical']['sma50'] > 0,
-                    stock_data['technical']['sma200'] > 0
-                ])
-            }
+            technical = stock_data['technical']
+            s1 = technical['rsi'] < 30
+            s2 = technical['relVolume'] > 2
+            s3 = (
+                technical['sma20'] > 0
+                and technical['sma50'] > 0
+                and technical['sma200'] > 0
+            )
             
-            confidence = sum(signals.values()) / len(signals)
+            confidence = (s1 + s2 + s3) / 3.0
+            signals = {'rsi_oversold': s1, 'volume_surge': s2, 'trend_following': s3}
             
             return {
                 'strategy': 'quantitative_edge',
@@ -134,9 +191,8 @@ class StrategyManager:
         Analyze a stock using one or all strategies
         """
         try:
-            # Fetch stock data
-            stock = yf.Ticker(symbol)
-            stock_data = stock.info
+            # Fetch stock data (fundamentals change at most quarterly, so serve from disk cache)
+            stock_data = get_or_fetch(symbol, lambda: yf.Ticker(symbol).info)
             
             if strategy_name and strategy_name in self.strategies:
                 return self.strategies[strategy_name](stock_data)